@@ -1,10 +1,19 @@
 import numpy
 import packaging.version
 
-# GSD - optional import
-try:
-    import gsd
-    import gsd.hoomd
+# optional imports are deferred until they are first needed because they are only
+# used for some file formats; each loader sets the module attributes it provides
+
+
+def _load_gsd():
+    global gsd_version, gsd_frame_class
+    try:
+        import gsd
+        import gsd.hoomd
+    except ModuleNotFoundError:
+        gsd_version = None
+        gsd_frame_class = None
+        return
 
     # determine how GSD stores its version
     try:
@@ -18,16 +27,44 @@ try:
         gsd_frame_class = gsd.hoomd.Frame
     else:
         gsd_frame_class = gsd.hoomd.Snapshot
-except ModuleNotFoundError:
-    gsd_version = None
 
-# pyzstd - optional import
-try:
-    import pyzstd
 
-    pyzstd_version = packaging.version.Version(pyzstd.__version__)
-except ModuleNotFoundError:
-    pyzstd_version = None
+def _load_isal():
+    global isal_version
+    try:
+        import isal
+
+        isal_version = packaging.version.Version(isal.__version__)
+    except ModuleNotFoundError:
+        isal_version = None
+
+
+def _load_pyzstd():
+    global pyzstd_version
+    try:
+        import pyzstd
+
+        pyzstd_version = packaging.version.Version(pyzstd.__version__)
+    except ModuleNotFoundError:
+        pyzstd_version = None
+
+
+_optional = {
+    "gsd_version": _load_gsd,
+    "gsd_frame_class": _load_gsd,
+    "isal_version": _load_isal,
+    "pyzstd_version": _load_pyzstd,
+}
+
+
+def __getattr__(name):
+    try:
+        load = _optional[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    load()
+    return globals()[name]
+
 
 # numpy
 # copy behavior changed in 2.0.0, see https://github.com/scipy/scipy/pull/20172
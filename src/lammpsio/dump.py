@@ -1,6 +1,10 @@
 import gzip
+import io
+import itertools
+import mmap
 import os
 import pathlib
+import shutil
 
 import numpy
 
@@ -9,8 +13,8 @@ from .box import Box
 from .data import _readline
 from .snapshot import Snapshot
 
-if _compatibility.pyzstd_version is not None:
-    import pyzstd
+# size of buffers for reading and writing compressed files
+_BUFFER_SIZE = 1 << 20
 
 
 class DumpFile:
@@ -46,7 +50,7 @@ class DumpFile:
     def __init__(self, filename, schema=None, sort_ids=True, copy_from=None):
         self.filename = filename
         self.schema = schema
-        self._frames = None
+        self._num_frames = None
         self.sort_ids = sort_ids
         self.copy_from = copy_from
 
@@ -82,14 +86,28 @@ class DumpFile:
                 dump_row.append((v, (k, None)))
         dump_row.sort(key=lambda x: x[0])
 
+        # format each row from a template so the format is only built once
+        row_format = []
+        for _, (key, _) in dump_row:
+            if key in ("id", "typeid", "molecule", "image"):
+                row_format.append("{:d}")
+            elif key in ("position", "velocity"):
+                row_format.append("{:.8f}")
+            else:
+                row_format.append("{:f}")
+        row_format = (" ".join(row_format) + "\n").format
+
         # make snapshots iterable
         try:
             snapshots = iter(snapshots)
         except TypeError:
             snapshots = [snapshots]
 
+        # count the frames so the new file does not need to be scanned
+        num_frames = 0
         with open(filename, "w") as f:
             for snap in snapshots:
+                num_frames += 1
                 f.write("ITEM: TIMESTEP\n" f"{snap.step}\n")
 
                 f.write("ITEM: NUMBER OF ATOMS\n")
@@ -138,46 +156,44 @@ class DumpFile:
                 schema_header = " ".join(schema_header)
 
                 f.write("ITEM: ATOMS " + schema_header + "\n")
-                for i in range(snap.N):
-                    line = ""
-                    for col, (key, key_idx) in dump_row:
-                        if key == "id":
-                            val = snap.id[i] if snap.has_id() else i + 1
-                        else:
-                            val = getattr(snap, key)[i]
-                            if key_idx is not None:
-                                val = val[key_idx]
-
-                        if key in ("id", "typeid", "molecule", "image"):
-                            fmt = "{:d}"
-                        elif key in ("position", "velocity"):
-                            fmt = "{:.8f}"
-                        else:
-                            fmt = "{:f}"
-
-                        if col > 0:
-                            fmt = " " + fmt
-                        line += fmt.format(val)
-                    line = line.strip()
-                    f.write(line + "\n")
+                columns = []
+                for _, (key, key_idx) in dump_row:
+                    if key == "id" and not snap.has_id():
+                        val = range(1, snap.N + 1)
+                    else:
+                        val = getattr(snap, key)
+                        if key_idx is not None:
+                            val = val[:, key_idx]
+                        val = val.tolist()
+                    columns.append(val)
+                f.writelines(row_format(*row) for row in zip(*columns))
 
         filename_path = pathlib.Path(filename)
         compression = cls._compression_from_suffix(filename_path.suffix)
         if compression:
             tmp = pathlib.Path(filename).with_suffix(filename_path.suffix + ".tmp")
             with open(filename, "rb") as src, compression.open(tmp, "wb") as dest:
-                dest.writelines(src)
+                shutil.copyfileobj(src, dest, _BUFFER_SIZE)
             os.replace(tmp, filename)
 
-        return DumpFile(filename, schema)
+        dump = DumpFile(filename, schema)
+        dump._num_frames = num_frames
+        return dump
 
     @staticmethod
     def _compression_from_suffix(suffix):
         if suffix == ".gz":
+            # isal is a faster drop-in replacement for gzip, if available
+            if _compatibility.isal_version is not None:
+                from isal import igzip
+
+                return igzip
             return gzip
         elif suffix == ".zst":
             if _compatibility.pyzstd_version is None:
                 raise ModuleNotFoundError("pyzstd needed for zstd compression")
+            import pyzstd
+
             return pyzstd
         else:
             return None
@@ -230,34 +246,83 @@ class DumpFile:
                 raise ValueError("Image must be a 3-tuple")
         self._schema = value
 
+    def _plan_columns(self):
+        """Plan the columns to parse from the current schema."""
+        # give each column a named field so integer columns are parsed as integers
+        schema = self.schema
+        dtypes = {}
+        for key in ("position", "velocity", "image"):
+            if key in schema:
+                for col in schema[key]:
+                    dtypes[col] = int if key == "image" else float
+        for key in ("id", "molecule", "typeid", "charge", "mass"):
+            if key in schema:
+                col = schema[key]
+                if key in ("id", "molecule", "typeid"):
+                    dtypes.setdefault(col, int)
+                else:
+                    dtypes[col] = float
+        usecols = sorted(dtypes)
+        dtype = [(f"c{col}", dtypes[col]) for col in usecols]
+        vectors = {}
+        for key in ("position", "velocity", "image"):
+            if key in schema:
+                vectors[key] = [f"c{col}" for col in schema[key]]
+        scalars = {}
+        for key in ("id", "molecule", "typeid", "charge", "mass"):
+            if key in schema:
+                scalars[key] = f"c{schema[key]}"
+        return usecols, dtype, vectors, scalars
+
     def _open(self):
         """Open the file handle for reading."""
         if self._compression:
-            f = self._compression.open(self.filename, "rb")
+            # an empty file has no compressed stream to read, which not all
+            # decompressors accept, so treat it as empty data
+            if os.path.isfile(self.filename) and os.path.getsize(self.filename) == 0:
+                return io.BytesIO()
+            # buffer the decompressed stream so lines are not read in small chunks
+            f = io.BufferedReader(
+                self._compression.open(self.filename, "rb"), _BUFFER_SIZE
+            )
         else:
             f = open(self.filename, "r")
         return f
 
-    def _find_frames(self):
-        """Seek line numbers for each frame."""
-        self._frames = []
-        with self._open() as f:
-            line = _readline(f)
-            line_num = 0
-            while len(line) > 0:
-                if self._section["step"] in line:
-                    self._frames.append(line_num)
+    def _count_frames(self):
+        """Count the frames in the file."""
+        self._num_frames = 0
+        if (
+            not self._compression
+            and os.path.isfile(self.filename)
+            and os.path.getsize(self.filename) > 0
+        ):
+            # search a memory map of the file rather than reading it line by line,
+            # which is only possible for a nonempty regular file
+            section = self._section["step"].encode()
+            with open(self.filename, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    offset = mm.find(section)
+                    while offset >= 0:
+                        self._num_frames += 1
+                        offset = mm.find(section, offset + len(section))
+        else:
+            with self._open() as f:
                 line = _readline(f)
-                line_num += 1
+                while len(line) > 0:
+                    if self._section["step"] in line:
+                        self._num_frames += 1
+                    line = _readline(f)
 
     def __len__(self):
-        if self._frames is None:
-            self._find_frames()
-        return len(self._frames)
+        if self._num_frames is None:
+            self._count_frames()
+        return self._num_frames
 
     def __iter__(self):
         with self._open() as f:
             state = 0
+            columns = None
             line = _readline(f)
             while len(line) > 0:
                 # timestep line first
@@ -347,39 +412,40 @@ class DumpFile:
                         self.schema = schema
 
                     snap = Snapshot(N, box, step)
-                    for i in range(snap.N):
-                        atom = _readline(f, True)
-                        atom = atom.split()
-
-                        if "id" in self.schema:
-                            id_ = int(atom[self.schema["id"]])
-                            if id_ != i + 1:
-                                snap.id[i] = id_
-                        if "position" in self.schema:
-                            snap.position[i] = [
-                                float(atom[j]) for j in self.schema["position"]
-                            ]
-                        if "velocity" in self.schema:
-                            snap.velocity[i] = [
-                                float(atom[j]) for j in self.schema["velocity"]
-                            ]
-                        if "image" in self.schema:
-                            snap.image[i] = [int(atom[j]) for j in self.schema["image"]]
-                        if "molecule" in self.schema:
-                            snap.molecule[i] = int(atom[self.schema["molecule"]])
-                        if "typeid" in self.schema:
-                            snap.typeid[i] = int(atom[self.schema["typeid"]])
-                        if "charge" in self.schema:
-                            snap.charge[i] = float(atom[self.schema["charge"]])
-                        if "mass" in self.schema:
-                            snap.mass[i] = float(atom[self.schema["mass"]])
+                    if N > 0:
+                        # parse the atom rows as one block, keeping only the
+                        # columns that are in the schema
+                        if columns is None:
+                            columns = self._plan_columns()
+                        usecols, dtype, vectors, scalars = columns
+                        lines = list(itertools.islice(f, N))
+                        if len(lines) != N:
+                            raise OSError("Could not read line from file")
+                        atoms = numpy.loadtxt(
+                            lines, dtype=dtype, usecols=usecols, ndmin=1
+                        )
+                        del lines
+
+                        if "id" in scalars:
+                            id_ = atoms[scalars["id"]]
+                            has_id = numpy.any(id_ != numpy.arange(1, N + 1))
+                            # optionally sort the particles by ID, permuting all
+                            # the rows at once if they are not already in order
+                            if self.sort_ids and numpy.any(id_[1:] < id_[:-1]):
+                                atoms = atoms[numpy.argsort(id_)]
+                                id_ = atoms[scalars["id"]]
+                            if has_id:
+                                snap.id = id_
+                        for key, names in vectors.items():
+                            setattr(
+                                snap, key, numpy.column_stack([atoms[n] for n in names])
+                            )
+                        for key, name in scalars.items():
+                            if key != "id":
+                                setattr(snap, key, atoms[name])
 
                 # final processing stage for the frame
                 if state == 4:
-                    # optionally sort the particles by ID
-                    if self.sort_ids and snap.has_id():
-                        snap.reorder(numpy.argsort(snap.id), check_order=False)
-
                     # optionally copy reference data by ID / index
                     if self._copy_from is not None:
                         if snap.N != self._copy_from.N:
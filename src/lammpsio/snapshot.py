@@ -64,15 +64,16 @@ class Snapshot:
             A map from the :attr:`Snapshot.typeid` to the HOOMD type.
 
         """
-        # ensures frame is well formed and that we have NumPy arrays
+        # ensures frame is well formed, but newer GSD versions do not convert the
+        # frame's data to NumPy arrays in place, so do not rely on that here
         frame.validate()
 
-        # process HOOMD box to LAMMPS box
-        L = frame.configuration.box[:3]
-        tilt = frame.configuration.box[3:]
+        # process HOOMD box to LAMMPS box, working on a copy so the frame is unchanged
+        box = numpy.array(frame.configuration.box, dtype=float)
+        L = box[:3]
+        tilt = box[3:]
         if frame.configuration.dimensions == 3:
-            tilt[0] *= L[1]
-            tilt[1:] *= L[2]
+            tilt *= L[[1, 2, 2]]
         elif frame.configuration.dimensions == 2:
             tilt[0] *= L[1]
             # HOOMD boxes can have Lz = 0, but LAMMPS does not allow this.
@@ -95,7 +96,7 @@ class Snapshot:
             snap.image = frame.particles.image
 
         if frame.particles.typeid is not None:
-            snap.typeid = frame.particles.typeid + 1
+            snap.typeid = numpy.add(frame.particles.typeid, 1)
 
         if frame.particles.charge is not None:
             snap.charge = frame.particles.charge
@@ -104,16 +105,14 @@ class Snapshot:
             snap.mass = frame.particles.mass
 
         if frame.particles.body is not None:
-            snap.molecule = frame.particles.body + 1
+            snap.molecule = numpy.add(frame.particles.body, 1)
             if numpy.any(snap.molecule < 0):
                 warnings.warn("Some molecule IDs are negative, remapping needed.")
 
         # set particle label
         label_map_particle = None
         if frame.particles.types is not None:
-            label_map_particle = {
-                typeid + 1: i for typeid, i in enumerate(frame.particles.types)
-            }
+            label_map_particle = dict(enumerate(frame.particles.types, start=1))
             snap.type_label = LabelMap(map=label_map_particle)
 
         if (
@@ -126,15 +125,13 @@ class Snapshot:
             snap.bonds = Bonds(N=frame.bonds.N)
 
             if frame.bonds.group is not None:
-                snap.bonds.members = frame.bonds.group + 1
+                snap.bonds.members = numpy.add(frame.bonds.group, 1)
 
             if frame.bonds.typeid is not None:
-                snap.bonds.typeid = frame.bonds.typeid + 1
+                snap.bonds.typeid = numpy.add(frame.bonds.typeid, 1)
 
             if frame.bonds.types is not None:
-                label_map_bond = {
-                    typeid + 1: i for typeid, i in enumerate(frame.bonds.types)
-                }
+                label_map_bond = dict(enumerate(frame.bonds.types, start=1))
                 snap.bonds.type_label = LabelMap(map=label_map_bond)
 
         if (
@@ -147,15 +144,13 @@ class Snapshot:
             snap.angles = Angles(N=frame.angles.N)
 
             if frame.angles.group is not None:
-                snap.angles.members = frame.angles.group + 1
+                snap.angles.members = numpy.add(frame.angles.group, 1)
 
             if frame.angles.typeid is not None:
-                snap.angles.typeid = frame.angles.typeid + 1
+                snap.angles.typeid = numpy.add(frame.angles.typeid, 1)
 
             if frame.angles.types is not None:
-                label_map_angle = {
-                    typeid + 1: i for typeid, i in enumerate(frame.angles.types)
-                }
+                label_map_angle = dict(enumerate(frame.angles.types, start=1))
                 snap.angles.type_label = LabelMap(map=label_map_angle)
 
         if (
@@ -168,15 +163,13 @@ class Snapshot:
             snap.dihedrals = Dihedrals(N=frame.dihedrals.N)
 
             if frame.dihedrals.group is not None:
-                snap.dihedrals.members = frame.dihedrals.group + 1
+                snap.dihedrals.members = numpy.add(frame.dihedrals.group, 1)
 
             if frame.dihedrals.typeid is not None:
-                snap.dihedrals.typeid = frame.dihedrals.typeid + 1
+                snap.dihedrals.typeid = numpy.add(frame.dihedrals.typeid, 1)
 
             if frame.dihedrals.types is not None:
-                label_map_dihedral = {
-                    typeid + 1: i for typeid, i in enumerate(frame.dihedrals.types)
-                }
+                label_map_dihedral = dict(enumerate(frame.dihedrals.types, start=1))
                 snap.dihedrals.type_label = LabelMap(map=label_map_dihedral)
 
         if (
@@ -189,15 +182,13 @@ class Snapshot:
             snap.impropers = Impropers(N=frame.impropers.N)
 
             if frame.impropers.group is not None:
-                snap.impropers.members = frame.impropers.group + 1
+                snap.impropers.members = numpy.add(frame.impropers.group, 1)
 
             if frame.impropers.typeid is not None:
-                snap.impropers.typeid = frame.impropers.typeid + 1
+                snap.impropers.typeid = numpy.add(frame.impropers.typeid, 1)
 
             if frame.impropers.types is not None:
-                label_map_improper = {
-                    typeid + 1: i for typeid, i in enumerate(frame.impropers.types)
-                }
+                label_map_improper = dict(enumerate(frame.impropers.types, start=1))
                 snap.impropers.type_label = LabelMap(map=label_map_improper)
 
         return snap, label_map_particle
@@ -230,7 +221,8 @@ class Snapshot:
             raise ValueError("GSD boxes must be centered around 0")
         L = self.box.high - self.box.low
         if self.box.tilt is not None:
-            tilt = self.box.tilt
+            # HOOMD tilt factors are normalized by the box lengths
+            tilt = self.box.tilt / L[[1, 2, 2]]
         else:
             tilt = [0, 0, 0]
         frame.configuration.box = numpy.concatenate((L, tilt))
@@ -241,17 +233,17 @@ class Snapshot:
             order = numpy.argsort(self.id)
             self.reorder(order, check_order=False)
             # build the reverse map to undo the sort later
-            reverse_order = numpy.zeros(self.N, dtype=int)
-            for i, v in enumerate(order):
-                reverse_order[v] = i
+            reverse_order = numpy.empty(self.N, dtype=int)
+            reverse_order[order] = numpy.arange(self.N)
 
+        # create arrays with the types GSD stores so they are not cast again
         frame.particles.N = self.N
         if self.has_position():
-            frame.particles.position = self.position.copy()
+            frame.particles.position = numpy.array(self.position, dtype=numpy.float32)
         if self.has_velocity():
-            frame.particles.velocity = self.velocity.copy()
+            frame.particles.velocity = numpy.array(self.velocity, dtype=numpy.float32)
         if self.has_image():
-            frame.particles.image = self.image.copy()
+            frame.particles.image = numpy.array(self.image, dtype=numpy.int32)
         if type_map is not None:
             warnings.warn(
                 "type_map is deprecated, use Snapshot.type_label instead.",
@@ -262,25 +254,29 @@ class Snapshot:
         else:
             type_label_map = self.type_label
         if self.has_typeid():
-            frame.particles.typeid = numpy.zeros(self.N, dtype=int)
+            frame.particles.typeid = numpy.zeros(self.N, dtype=numpy.uint32)
             type_label_map = _set_type_id(
                 self.typeid, frame.particles.typeid, type_label_map
             )
             frame.particles.types = type_label_map.types
         if self.has_charge():
-            frame.particles.charge = self.charge.copy()
+            frame.particles.charge = numpy.array(self.charge, dtype=numpy.float32)
         if self.has_mass():
-            frame.particles.mass = self.mass.copy()
+            frame.particles.mass = numpy.array(self.mass, dtype=numpy.float32)
         if self.has_molecule():
-            frame.particles.body = self.molecule - 1
+            frame.particles.body = numpy.subtract(
+                self.molecule, 1, dtype=numpy.int32, casting="unsafe"
+            )
 
         if self.bonds is not None:
             frame.bonds.N = self.bonds.N
             if self.bonds.has_members():
-                frame.bonds.group = self.bonds.members - 1
+                frame.bonds.group = numpy.subtract(
+                    self.bonds.members, 1, dtype=numpy.uint32, casting="unsafe"
+                )
             bond_label_map = self.bonds.type_label
             if self.bonds.has_typeid():
-                frame.bonds.typeid = numpy.zeros(self.bonds.N, dtype=int)
+                frame.bonds.typeid = numpy.zeros(self.bonds.N, dtype=numpy.uint32)
                 bond_label_map = _set_type_id(
                     self.bonds.typeid,
                     frame.bonds.typeid,
@@ -291,10 +287,12 @@ class Snapshot:
         if self.angles is not None:
             frame.angles.N = self.angles.N
             if self.angles.has_members():
-                frame.angles.group = self.angles.members - 1
+                frame.angles.group = numpy.subtract(
+                    self.angles.members, 1, dtype=numpy.uint32, casting="unsafe"
+                )
             angle_label_map = self.angles.type_label
             if self.angles.has_typeid():
-                frame.angles.typeid = numpy.zeros(self.angles.N, dtype=int)
+                frame.angles.typeid = numpy.zeros(self.angles.N, dtype=numpy.uint32)
                 angle_label_map = _set_type_id(
                     self.angles.typeid,
                     frame.angles.typeid,
@@ -305,10 +303,14 @@ class Snapshot:
         if self.dihedrals is not None:
             frame.dihedrals.N = self.dihedrals.N
             if self.dihedrals.has_members():
-                frame.dihedrals.group = self.dihedrals.members - 1
+                frame.dihedrals.group = numpy.subtract(
+                    self.dihedrals.members, 1, dtype=numpy.uint32, casting="unsafe"
+                )
             dihedral_label_map = self.dihedrals.type_label
             if self.dihedrals.has_typeid():
-                frame.dihedrals.typeid = numpy.zeros(self.dihedrals.N, dtype=int)
+                frame.dihedrals.typeid = numpy.zeros(
+                    self.dihedrals.N, dtype=numpy.uint32
+                )
                 dihedral_label_map = _set_type_id(
                     self.dihedrals.typeid,
                     frame.dihedrals.typeid,
@@ -319,10 +321,14 @@ class Snapshot:
         if self.impropers is not None:
             frame.impropers.N = self.impropers.N
             if self.impropers.has_members():
-                frame.impropers.group = self.impropers.members - 1
+                frame.impropers.group = numpy.subtract(
+                    self.impropers.members, 1, dtype=numpy.uint32, casting="unsafe"
+                )
             improper_label_map = self.impropers.type_label
             if self.impropers.has_typeid():
-                frame.impropers.typeid = numpy.zeros(self.impropers.N, dtype=int)
+                frame.impropers.typeid = numpy.zeros(
+                    self.impropers.N, dtype=numpy.uint32
+                )
                 improper_label_map = _set_type_id(
                     self.impropers.typeid,
                     frame.impropers.typeid,
@@ -362,7 +368,7 @@ class Snapshot:
             if v.shape != (self.N,):
                 raise TypeError("Ids must be a size N array")
             if not self.has_id():
-                self._id = numpy.arange(1, self.N + 1)
+                self._id = numpy.empty(self.N, dtype=int)
             numpy.copyto(self._id, v)
         else:
             self._id = None
@@ -394,7 +400,7 @@ class Snapshot:
             if v.shape != (self.N, 3):
                 raise TypeError("Positions must be an Nx3 array")
             if not self.has_position():
-                self._position = numpy.zeros((self.N, 3), dtype=float)
+                self._position = numpy.empty((self.N, 3), dtype=float)
             numpy.copyto(self._position, v)
         else:
             self._position = None
@@ -426,7 +432,7 @@ class Snapshot:
             if v.shape != (self.N, 3):
                 raise TypeError("Images must be an Nx3 array")
             if not self.has_image():
-                self._image = numpy.zeros((self.N, 3), dtype=int)
+                self._image = numpy.empty((self.N, 3), dtype=int)
             numpy.copyto(self._image, v)
         else:
             self._image = None
@@ -458,7 +464,7 @@ class Snapshot:
             if v.shape != (self.N, 3):
                 raise TypeError("Velocities must be an Nx3 array")
             if not self.has_velocity():
-                self._velocity = numpy.zeros((self.N, 3), dtype=float)
+                self._velocity = numpy.empty((self.N, 3), dtype=float)
             numpy.copyto(self._velocity, v)
         else:
             self._velocity = None
@@ -490,7 +496,7 @@ class Snapshot:
             if v.shape != (self.N,):
                 raise TypeError("Molecules must be a size N array")
             if not self.has_molecule():
-                self._molecule = numpy.zeros(self.N, dtype=int)
+                self._molecule = numpy.empty(self.N, dtype=int)
             numpy.copyto(self._molecule, v)
         else:
             self._molecule = None
@@ -540,7 +546,7 @@ class Snapshot:
             if v.shape != (self.N,):
                 raise TypeError("Type must be a size N array")
             if not self.has_typeid():
-                self._typeid = numpy.ones(self.N, dtype=int)
+                self._typeid = numpy.empty(self.N, dtype=int)
             numpy.copyto(self._typeid, v)
         else:
             self._typeid = None
@@ -572,7 +578,7 @@ class Snapshot:
             if v.shape != (self.N,):
                 raise TypeError("Charge must be a size N array")
             if not self.has_charge():
-                self._charge = numpy.zeros(self.N, dtype=float)
+                self._charge = numpy.empty(self.N, dtype=float)
             numpy.copyto(self._charge, v)
         else:
             self._charge = None
@@ -604,7 +610,7 @@ class Snapshot:
             if v.shape != (self.N,):
                 raise TypeError("Mass must be a size N array")
             if not self.has_mass():
-                self._mass = numpy.ones(self.N, dtype=float)
+                self._mass = numpy.empty(self.N, dtype=float)
             numpy.copyto(self._mass, v)
         else:
             self._mass = None
@@ -796,10 +802,19 @@ def _set_type_id(lammps_typeid, gsd_typeid, label_map):
         label_map = {typeid: str(typeid) for typeid in sorted_typeids}
         label_map = LabelMap(map=label_map)
 
-    hoomd_type_map = {
-        typeid: typeidx for typeidx, typeid in enumerate(label_map.keys())
-    }
-    for i, typeid in enumerate(lammps_typeid):
-        gsd_typeid[i] = hoomd_type_map[typeid]
+    # look up the index of each typeid in the label map all at once by
+    # searching the sorted typeids
+    typeids = numpy.array(list(label_map.keys()), dtype=int)
+    lammps_typeid = numpy.asarray(lammps_typeid, dtype=int)
+    if lammps_typeid.size > 0:
+        if typeids.size == 0:
+            raise KeyError(int(lammps_typeid[0]))
+        sorter = numpy.argsort(typeids)
+        idx = numpy.searchsorted(typeids, lammps_typeid, sorter=sorter)
+        idx = sorter[numpy.minimum(idx, typeids.size - 1)]
+        missing = typeids[idx] != lammps_typeid
+        if numpy.any(missing):
+            raise KeyError(int(lammps_typeid[missing][0]))
+        gsd_typeid[:] = idx
 
     return label_map
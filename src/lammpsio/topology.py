@@ -1,4 +1,5 @@
 import collections.abc
+import copy
 
 import numpy
 
@@ -55,7 +56,7 @@ class Topology:
             if v.shape != (self.N,):
                 raise TypeError("Ids must be a size N array")
             if not self.has_id():
-                self._id = numpy.arange(1, self.N + 1)
+                self._id = numpy.empty(self.N, dtype=int)
             numpy.copyto(self._id, v)
         else:
             self._id = None
@@ -87,7 +88,7 @@ class Topology:
             if v.shape != (self.N,):
                 raise TypeError("typeids must be a size N array")
             if not self.has_typeid():
-                self._typeid = numpy.ones(self.N, dtype=int)
+                self._typeid = numpy.empty(self.N, dtype=int)
             numpy.copyto(self._typeid, v)
         else:
             self._typeid = None
@@ -119,7 +120,7 @@ class Topology:
             if v.shape != (self.N, self._num_members):
                 raise TypeError("Members must be a size N x number of members array")
             if not self.has_members():
-                self._members = numpy.ones((self.N, self._num_members), dtype=int)
+                self._members = numpy.empty((self.N, self._num_members), dtype=int)
             numpy.copyto(self._members, v)
         else:
             self._members = None
@@ -179,6 +180,11 @@ class Topology:
             If true, validate the new ``order`` before applying it.
 
         """
+        # convert to an index array once so it is not repeated for every field
+        order = numpy.array(
+            order, ndmin=1, copy=_compatibility.numpy_copy_if_needed, dtype=int
+        )
+
         # sanity check the sorting order before applying it
         if check_order and self.N > 1:
             sorted_order = numpy.sort(order)
@@ -273,6 +279,8 @@ class LabelMap(collections.abc.MutableMapping):
 
     def __init__(self, map=None):
         self._map = {}
+        self._types = None
+        self._typeid = None
         if map is not None:
             self.update(map)
 
@@ -281,22 +289,36 @@ class LabelMap(collections.abc.MutableMapping):
 
     def __setitem__(self, key, value):
         self._map[key] = value
+        self._types = None
+        self._typeid = None
 
     def __delitem__(self, key):
         del self._map[key]
+        self._types = None
+        self._typeid = None
 
     def __iter__(self):
         return iter(self._map)
 
+    def __copy__(self):
+        return type(self)(self._map)
+
+    def __deepcopy__(self, memo):
+        return type(self)(copy.deepcopy(self._map, memo))
+
     def __len__(self):
         return len(self._map)
 
     @property
     def types(self):
         """tuple: Types in label map."""
-        return tuple(self._map.values())
+        if self._types is None:
+            self._types = tuple(self._map.values())
+        return self._types
 
     @property
     def typeid(self):
         """tuple: Typeids in label map."""
-        return tuple(self._map.keys())
+        if self._typeid is None:
+            self._typeid = tuple(self._map.keys())
+        return self._typeid
@@ -3,6 +3,42 @@ import pytest
 
 import lammpsio
 
+# per-particle values for the 3-particle snapshot, shared across parametrizations
+_POSITION_3 = numpy.array(
+    [[0.1, 0.2, 0.3], [-0.4, -0.5, -0.6], [0.7, 0.8, 0.9]], dtype=float
+)
+_IMAGE_3 = numpy.array([[1, 2, 3], [-4, -5, -6], [7, 8, 9]], dtype=int)
+_VELOCITY_3 = numpy.array([[-3, -2, -1], [6, 5, 4], [9, 8, 7]], dtype=float)
+_TYPEID_3 = numpy.array([2, 1, 2], dtype=int)
+_MASS_3 = numpy.array([3, 2, 3], dtype=float)
+_MOLECULE_3 = numpy.array([2, 0, 1], dtype=int)
+_CHARGE_3 = numpy.array([-1, 0, 1], dtype=float)
+
+# ground truth for the 8-particle topology tests, shared across parametrizations
+_TYPEID_8 = numpy.array([1, 1, 1, 1, 2, 2, 2, 2], dtype=int)
+_POSITION_8 = numpy.array(
+    [
+        [0, 0, 0],
+        [0.1, 0.1, 0.1],
+        [0.2, 0.2, 0.2],
+        [0.3, 0.3, 0.3],
+        [1, 1, 1],
+        [1.1, 1.1, 1.1],
+        [1.2, 1.2, 1.2],
+        [1.3, 1.3, 1.3],
+    ],
+    dtype=float,
+)
+_MASS_8 = numpy.array([1, 1, 1, 1, 2, 2, 2, 2], dtype=float)
+_BOND_TYPEID = numpy.array([1, 2, 1, 2, 1, 2], dtype=int)
+_BOND_MEMBERS = numpy.array([[1, 2], [2, 3], [3, 4], [5, 6], [6, 7], [7, 8]], dtype=int)
+_ANGLE_TYPEID = numpy.array([1, 2, 2, 1], dtype=int)
+_ANGLE_MEMBERS = numpy.array([[1, 2, 3], [2, 3, 4], [5, 6, 7], [6, 7, 8]], dtype=int)
+_DIHEDRAL_TYPEID = numpy.array([1, 2], dtype=int)
+_DIHEDRAL_MEMBERS = numpy.array([[1, 2, 3, 4], [5, 6, 7, 8]], dtype=int)
+_IMPROPER_TYPEID = numpy.array([1, 2], dtype=int)
+_IMPROPER_MEMBERS = numpy.array([[1, 2, 3, 4], [5, 6, 7, 8]], dtype=int)
+
 
 @pytest.mark.parametrize("shuffle_ids", [False, True])
 @pytest.mark.parametrize("atom_style", ["atomic", "molecular", "charge", "full"])
@@ -55,15 +91,15 @@ def test_data_file_all(snap, atom_style, set_style, shuffle_ids, tmp_path):
     if shuffle_ids:
         snap.id = [2, 0, 1]
     # write the data file with nondefault values
-    snap.position = [[0.1, 0.2, 0.3], [-0.4, -0.5, -0.6], [0.7, 0.8, 0.9]]
-    snap.image = [[1, 2, 3], [-4, -5, -6], [7, 8, 9]]
-    snap.velocity = [[-3, -2, -1], [6, 5, 4], [9, 8, 7]]
-    snap.typeid = [2, 1, 2]
-    snap.mass = [3, 2, 3]
+    snap.position = _POSITION_3
+    snap.image = _IMAGE_3
+    snap.velocity = _VELOCITY_3
+    snap.typeid = _TYPEID_3
+    snap.mass = _MASS_3
     if atom_style in ("molecular", "full"):
-        snap.molecule = [2, 0, 1]
+        snap.molecule = _MOLECULE_3
     if atom_style in ("charge", "full"):
-        snap.charge = [-1, 0, 1]
+        snap.charge = _CHARGE_3
     filename = tmp_path / "atoms.data"
     data = lammpsio.DataFile.create(filename, snap, atom_style if set_style else None)
     assert filename.exists
@@ -123,60 +159,33 @@ def test_data_file_topology(snap_8, tmp_path, shuffle_ids):
 
     # particle information
     snap_8.id = particle_id
-    snap_8.typeid = [1, 1, 1, 1, 2, 2, 2, 2]
-    snap_8.position = [
-        [0, 0, 0],
-        [0.1, 0.1, 0.1],
-        [0.2, 0.2, 0.2],
-        [0.3, 0.3, 0.3],
-        [1, 1, 1],
-        [1.1, 1.1, 1.1],
-        [1.2, 1.2, 1.2],
-        [1.3, 1.3, 1.3],
-    ]
-    snap_8.mass = [1, 1, 1, 1, 2, 2, 2, 2]
+    snap_8.typeid = _TYPEID_8
+    snap_8.position = _POSITION_8
+    snap_8.mass = _MASS_8
 
     # bond information
     snap_8.bonds = lammpsio.topology.Bonds(N=6, num_types=2)
     snap_8.bonds.id = bond_id
-    snap_8.bonds.typeid = [1, 2, 1, 2, 1, 2]
-    snap_8.bonds.members = [
-        [1, 2],
-        [2, 3],
-        [3, 4],
-        [5, 6],
-        [6, 7],
-        [7, 8],
-    ]
+    snap_8.bonds.typeid = _BOND_TYPEID
+    snap_8.bonds.members = _BOND_MEMBERS
 
     # angle information
     snap_8.angles = lammpsio.topology.Angles(N=4, num_types=2)
     snap_8.angles.id = angle_id
-    snap_8.angles.typeid = [1, 2, 2, 1]
-    snap_8.angles.members = [
-        [1, 2, 3],
-        [2, 3, 4],
-        [5, 6, 7],
-        [6, 7, 8],
-    ]
+    snap_8.angles.typeid = _ANGLE_TYPEID
+    snap_8.angles.members = _ANGLE_MEMBERS
 
     # dihedral information
     snap_8.dihedrals = lammpsio.topology.Dihedrals(N=2, num_types=2)
     snap_8.dihedrals.id = dihedral_id
-    snap_8.dihedrals.typeid = [1, 2]
-    snap_8.dihedrals.members = [
-        [1, 2, 3, 4],
-        [5, 6, 7, 8],
-    ]
+    snap_8.dihedrals.typeid = _DIHEDRAL_TYPEID
+    snap_8.dihedrals.members = _DIHEDRAL_MEMBERS
 
     # improper information
     snap_8.impropers = lammpsio.topology.Impropers(N=2, num_types=2)
     snap_8.impropers.id = improper_id
-    snap_8.impropers.typeid = [1, 2]
-    snap_8.impropers.members = [
-        [1, 2, 3, 4],
-        [5, 6, 7, 8],
-    ]
+    snap_8.impropers.typeid = _IMPROPER_TYPEID
+    snap_8.impropers.members = _IMPROPER_MEMBERS
 
     filename = tmp_path / "atoms.data"
     data = lammpsio.DataFile.create(filename, snap_8)
@@ -1,22 +1,30 @@
 import copy
+import importlib.util
+import os
+import threading
 
 import numpy
 import pytest
 
 import lammpsio
 
-try:
-    import pyzstd  # noqa: F401
+has_pyzstd = importlib.util.find_spec("pyzstd") is not None
 
-    has_pyzstd = True
-except ModuleNotFoundError:
-    has_pyzstd = False
+# per-particle values for the 3-particle snapshot, shared across parametrizations
+_POSITION_3 = numpy.array(
+    [[0.1, 0.2, 0.3], [-0.4, -0.5, -0.6], [0.7, 0.8, 0.9]], dtype=float
+)
+_IMAGE_3 = numpy.array([[1, 2, 3], [-4, -5, -6], [7, 8, 9]], dtype=int)
+_VELOCITY_3 = numpy.array([[-3, -2, -1], [6, 5, 4], [9, 8, 7]], dtype=float)
+_TYPEID_3 = numpy.array([2, 1, 2], dtype=int)
+_MASS_3 = numpy.array([3, 2, 3], dtype=float)
+_MOLECULE_3 = numpy.array([2, 0, 1], dtype=int)
+_CHARGE_3 = numpy.array([-1, 0, 1], dtype=float)
 
 
-@pytest.mark.parametrize("sort_ids", [False, True])
 @pytest.mark.parametrize("shuffle_ids", [False, True])
 @pytest.mark.parametrize("compression_extension", ["", ".gz", ".zst"])
-def test_dump_file_min(snap, compression_extension, shuffle_ids, sort_ids, tmp_path):
+def test_dump_file_min(snap, compression_extension, shuffle_ids, tmp_path):
     if not has_pyzstd and compression_extension == ".zst":
         pytest.skip("pyzstd not installed")
 
@@ -33,52 +41,54 @@ def test_dump_file_min(snap, compression_extension, shuffle_ids, sort_ids, tmp_p
     assert filename.exists
     assert len(f) == 2
 
-    # read it back in and check snapshots
-    f2 = lammpsio.DumpFile(filename, sort_ids=sort_ids)
-    read_snaps = [s for s in f2]
-    for i in range(2):
-        assert read_snaps[i].N == snaps[i].N
-        assert read_snaps[i].step == snaps[i].step
-        assert numpy.allclose(read_snaps[i].box.low, snaps[i].box.low)
-        assert numpy.allclose(read_snaps[i].box.high, snaps[i].box.high)
-        if snaps[i].box.tilt is not None:
-            assert numpy.allclose(read_snaps[i].box.tilt, snaps[i].box.tilt)
-        else:
-            assert read_snaps[i].box.tilt is None
-        if shuffle_ids:
-            assert read_snaps[i].has_id()
-            if sort_ids:
-                assert numpy.allclose(read_snaps[i].id, numpy.arange(1, snaps[i].N + 1))
+    # read the same file back in with and without sorting and check snapshots
+    for sort_ids in (False, True):
+        f2 = lammpsio.DumpFile(filename, sort_ids=sort_ids)
+        read_snaps = [s for s in f2]
+        for i in range(2):
+            assert read_snaps[i].N == snaps[i].N
+            assert read_snaps[i].step == snaps[i].step
+            assert numpy.allclose(read_snaps[i].box.low, snaps[i].box.low)
+            assert numpy.allclose(read_snaps[i].box.high, snaps[i].box.high)
+            if snaps[i].box.tilt is not None:
+                assert numpy.allclose(read_snaps[i].box.tilt, snaps[i].box.tilt)
             else:
-                assert numpy.allclose(
-                    read_snaps[i].id, numpy.arange(1, snaps[i].N + 1)[::-1]
-                )
-        else:
-            assert not read_snaps[i].has_id()
-        assert read_snaps[i].has_position()
-        assert numpy.allclose(read_snaps[i].position, 0)
-        assert not read_snaps[i].has_image()
-        assert not read_snaps[i].has_velocity()
-        assert not read_snaps[i].has_typeid()
-        assert not read_snaps[i].has_mass()
-        assert not read_snaps[i].has_molecule()
-        assert not read_snaps[i].has_charge()
-
-
-@pytest.mark.parametrize("sort_ids", [False, True])
+                assert read_snaps[i].box.tilt is None
+            if shuffle_ids:
+                assert read_snaps[i].has_id()
+                if sort_ids:
+                    assert numpy.array_equal(
+                        read_snaps[i].id, numpy.arange(1, snaps[i].N + 1)
+                    )
+                else:
+                    assert numpy.array_equal(
+                        read_snaps[i].id, numpy.arange(1, snaps[i].N + 1)[::-1]
+                    )
+            else:
+                assert not read_snaps[i].has_id()
+            assert read_snaps[i].has_position()
+            assert numpy.allclose(read_snaps[i].position, 0)
+            assert not read_snaps[i].has_image()
+            assert not read_snaps[i].has_velocity()
+            assert not read_snaps[i].has_typeid()
+            assert not read_snaps[i].has_mass()
+            assert not read_snaps[i].has_molecule()
+            assert not read_snaps[i].has_charge()
+
+
 @pytest.mark.parametrize("shuffle_ids", [False, True])
 @pytest.mark.parametrize("compression_extension", ["", ".gz", ".zst"])
-def test_dump_file_all(snap, compression_extension, shuffle_ids, sort_ids, tmp_path):
+def test_dump_file_all(snap, compression_extension, shuffle_ids, tmp_path):
     if not has_pyzstd and compression_extension == ".zst":
         pytest.skip("pyzstd not installed")
 
-    snap.position = [[0.1, 0.2, 0.3], [-0.4, -0.5, -0.6], [0.7, 0.8, 0.9]]
-    snap.image = [[1, 2, 3], [-4, -5, -6], [7, 8, 9]]
-    snap.velocity = [[-3, -2, -1], [6, 5, 4], [9, 8, 7]]
-    snap.typeid = [2, 1, 2]
-    snap.mass = [3, 2, 3]
-    snap.molecule = [2, 0, 1]
-    snap.charge = [-1, 0, 1]
+    snap.position = _POSITION_3
+    snap.image = _IMAGE_3
+    snap.velocity = _VELOCITY_3
+    snap.typeid = _TYPEID_3
+    snap.mass = _MASS_3
+    snap.molecule = _MOLECULE_3
+    snap.charge = _CHARGE_3
 
     snap_2 = lammpsio.Snapshot(snap.N, snap.box, snap.step + 1)
     snap_2.position = snap.position[::-1]
@@ -93,12 +103,6 @@ def test_dump_file_all(snap, compression_extension, shuffle_ids, sort_ids, tmp_p
     if shuffle_ids:
         for s in snaps:
             s.id = s.id[::-1]
-        if sort_ids:
-            order = numpy.arange(snap.N)[::-1]
-        else:
-            order = numpy.arange(snap.N)
-    else:
-        order = numpy.arange(snap.N)
 
     # create file with 2 snapshots
     schema = {
@@ -117,54 +121,144 @@ def test_dump_file_all(snap, compression_extension, shuffle_ids, sort_ids, tmp_p
     assert filename.exists
     assert len(f) == 2
 
-    # read it back in and check snapshots
-    f2 = lammpsio.DumpFile(filename, sort_ids=sort_ids)
-    read_snaps = [s for s in f2]
-    for i, s in enumerate(f):
-        assert read_snaps[i].N == snaps[i].N
-        assert read_snaps[i].step == snaps[i].step
-        assert numpy.allclose(read_snaps[i].box.low, snaps[i].box.low)
-        assert numpy.allclose(read_snaps[i].box.high, snaps[i].box.high)
-        if snaps[i].box.tilt is not None:
-            assert numpy.allclose(read_snaps[i].box.tilt, snaps[i].box.tilt)
+    # read the same file back in with and without sorting and check snapshots
+    for sort_ids in (False, True):
+        if shuffle_ids and sort_ids:
+            order = numpy.arange(snap.N)[::-1]
         else:
-            assert read_snaps[i].box.tilt is None
-        if shuffle_ids:
-            assert read_snaps[i].has_id()
-            if sort_ids:
-                assert numpy.allclose(read_snaps[i].id, numpy.arange(1, snaps[i].N + 1))
+            order = numpy.arange(snap.N)
+        f2 = lammpsio.DumpFile(filename, sort_ids=sort_ids)
+        read_snaps = [s for s in f2]
+        for i, s in enumerate(f):
+            assert read_snaps[i].N == snaps[i].N
+            assert read_snaps[i].step == snaps[i].step
+            assert numpy.allclose(read_snaps[i].box.low, snaps[i].box.low)
+            assert numpy.allclose(read_snaps[i].box.high, snaps[i].box.high)
+            if snaps[i].box.tilt is not None:
+                assert numpy.allclose(read_snaps[i].box.tilt, snaps[i].box.tilt)
             else:
-                assert numpy.allclose(
-                    read_snaps[i].id, numpy.arange(1, snaps[i].N + 1)[::-1]
-                )
-        else:
-            assert not read_snaps[i].has_id()
-        assert read_snaps[i].has_position()
-        assert numpy.allclose(read_snaps[i].position, snaps[i].position[order])
-        assert read_snaps[i].has_image()
-        assert numpy.allclose(read_snaps[i].image, snaps[i].image[order])
-        assert read_snaps[i].has_velocity()
-        assert numpy.allclose(read_snaps[i].velocity, snaps[i].velocity[order])
-        assert read_snaps[i].has_typeid()
-        assert numpy.allclose(read_snaps[i].typeid, snaps[i].typeid[order])
-        assert read_snaps[i].has_mass()
-        assert numpy.allclose(read_snaps[i].mass, snaps[i].mass[order])
-        assert read_snaps[i].has_molecule()
-        assert numpy.allclose(read_snaps[i].molecule, snaps[i].molecule[order])
-        assert read_snaps[i].has_charge()
-        assert numpy.allclose(read_snaps[i].charge, snaps[i].charge[order])
+                assert read_snaps[i].box.tilt is None
+            if shuffle_ids:
+                assert read_snaps[i].has_id()
+                if sort_ids:
+                    assert numpy.array_equal(
+                        read_snaps[i].id, numpy.arange(1, snaps[i].N + 1)
+                    )
+                else:
+                    assert numpy.array_equal(
+                        read_snaps[i].id, numpy.arange(1, snaps[i].N + 1)[::-1]
+                    )
+            else:
+                assert not read_snaps[i].has_id()
+            assert read_snaps[i].has_position()
+            assert numpy.allclose(read_snaps[i].position, snaps[i].position[order])
+            assert read_snaps[i].has_image()
+            assert numpy.array_equal(read_snaps[i].image, snaps[i].image[order])
+            assert read_snaps[i].has_velocity()
+            assert numpy.allclose(read_snaps[i].velocity, snaps[i].velocity[order])
+            assert read_snaps[i].has_typeid()
+            assert numpy.array_equal(read_snaps[i].typeid, snaps[i].typeid[order])
+            assert read_snaps[i].has_mass()
+            assert numpy.allclose(read_snaps[i].mass, snaps[i].mass[order])
+            assert read_snaps[i].has_molecule()
+            assert numpy.array_equal(read_snaps[i].molecule, snaps[i].molecule[order])
+            assert read_snaps[i].has_charge()
+            assert numpy.allclose(read_snaps[i].charge, snaps[i].charge[order])
+
+
+@pytest.mark.parametrize("compression_extension", ["", ".gz", ".zst"])
+def test_dump_file_len(snap, compression_extension, tmp_path):
+    if not has_pyzstd and compression_extension == ".zst":
+        pytest.skip("pyzstd not installed")
+
+    snaps = [copy.deepcopy(snap) for _ in range(3)]
+    for i, s in enumerate(snaps):
+        s.step = 10 * i
+    filename = tmp_path / f"atoms.lammpstrj{compression_extension}"
+    f = lammpsio.DumpFile.create(filename, {"id": 0}, snaps)
+    assert len(f) == 3
+
+    # a newly opened file finds the same frames
+    f2 = lammpsio.DumpFile(filename)
+    assert len(f2) == 3
+    assert [s.step for s in f2] == [s.step for s in snaps]
+
+
+@pytest.mark.parametrize("compression_extension", ["", ".gz", ".zst"])
+def test_dump_file_len_empty(compression_extension, tmp_path):
+    if not has_pyzstd and compression_extension == ".zst":
+        pytest.skip("pyzstd not installed")
+
+    filename = tmp_path / f"atoms.lammpstrj{compression_extension}"
+    f = lammpsio.DumpFile.create(filename, {"id": 0}, [])
+    assert len(f) == 0
+
+    # a newly opened empty file has no frames
+    f2 = lammpsio.DumpFile(filename)
+    assert len(f2) == 0
+    assert [s for s in f2] == []
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipes not supported")
+def test_dump_file_len_pipe(snap, tmp_path):
+    filename = tmp_path / "atoms.lammpstrj"
+    lammpsio.DumpFile.create(filename, {"id": 0}, [snap, snap])
+    pipe = tmp_path / "pipe.lammpstrj"
+    os.mkfifo(pipe)
+
+    # frames are counted from a pipe that cannot be memory mapped
+    writer = threading.Thread(target=lambda: pipe.write_bytes(filename.read_bytes()))
+    writer.start()
+    try:
+        assert len(lammpsio.DumpFile(pipe)) == 2
+    finally:
+        # unblock the writer if the pipe was never read
+        if writer.is_alive():
+            with open(pipe, "rb") as f:
+                f.read()
+        writer.join()
+
+
+def test_dump_file_large_id(snap, tmp_path):
+    # integer columns are parsed exactly, even beyond float precision
+    snap.id = [2**53 + 1, 2**53 + 3, 2**53 + 5]
+    snap.typeid = _TYPEID_3
+    filename = tmp_path / "atoms.lammpstrj"
+    schema = {"id": 0, "typeid": 1, "position": (2, 3, 4)}
+    lammpsio.DumpFile.create(filename, schema, snap)
+
+    read_snap = [s for s in lammpsio.DumpFile(filename)][0]
+    assert numpy.array_equal(read_snap.id, snap.id)
+    assert numpy.array_equal(read_snap.typeid, snap.typeid)
+
+
+def test_dump_file_schema_edit(snap, tmp_path):
+    snap.charge = _CHARGE_3
+    filename = tmp_path / "atoms.lammpstrj"
+    f = lammpsio.DumpFile.create(
+        filename, {"id": 0, "position": (1, 2, 3), "charge": 4}, snap
+    )
+
+    # edits to the schema are used the next time the file is read
+    del f.schema["charge"]
+    read_snap = [s for s in f][0]
+    assert not read_snap.has_charge()
+    f.schema["charge"] = 4
+    read_snap = [s for s in f][0]
+    assert read_snap.has_charge()
+    assert numpy.allclose(read_snap.charge, snap.charge)
 
 
 def test_copy_from(snap, tmp_path):
-    ref_snap = copy.deepcopy(snap)
+    ref_snap = lammpsio.Snapshot(snap.N, snap.box, snap.step)
     ref_snap.id = [12, 0, 1]
-    ref_snap.typeid = [2, 1, 2]
-    ref_snap.mass = [3, 2, 3]
-    ref_snap.molecule = [2, 0, 1]
-    ref_snap.charge = [-1, 0, 1]
+    ref_snap.typeid = _TYPEID_3
+    ref_snap.mass = _MASS_3
+    ref_snap.molecule = _MOLECULE_3
+    ref_snap.charge = _CHARGE_3
 
     snap.id = [0, 1, 12]
-    snap.position = [[0.1, 0.2, 0.3], [-0.4, -0.5, -0.6], [0.7, 0.8, 0.9]]
+    snap.position = _POSITION_3
 
     filename = tmp_path / "atoms.lammpstrj"
     schema = {"id": 0, "position": (1, 2, 3)}
@@ -183,7 +277,7 @@ def test_copy_from(snap, tmp_path):
     else:
         assert read_snap.box.tilt is None
     assert read_snap.has_id()
-    assert numpy.allclose(read_snap.id, snap.id)
+    assert numpy.array_equal(read_snap.id, snap.id)
     assert read_snap.has_position()
     assert numpy.allclose(read_snap.position, snap.position)
     assert not read_snap.has_image()
@@ -263,24 +357,24 @@ def test_copy_from_topology(snap_8, tmp_path):
 
     # test bonds
     assert read_snap_8.has_bonds()
-    assert numpy.allclose(read_snap_8.bonds.id, snap_8.bonds.id)
-    assert numpy.allclose(read_snap_8.bonds.typeid, snap_8.bonds.typeid)
-    assert numpy.allclose(read_snap_8.bonds.members, snap_8.bonds.members)
+    assert numpy.array_equal(read_snap_8.bonds.id, snap_8.bonds.id)
+    assert numpy.array_equal(read_snap_8.bonds.typeid, snap_8.bonds.typeid)
+    assert numpy.array_equal(read_snap_8.bonds.members, snap_8.bonds.members)
     # test angles
     assert read_snap_8.has_angles()
-    assert numpy.allclose(read_snap_8.angles.id, snap_8.angles.id)
-    assert numpy.allclose(read_snap_8.angles.typeid, snap_8.angles.typeid)
-    assert numpy.allclose(read_snap_8.angles.members, snap_8.angles.members)
+    assert numpy.array_equal(read_snap_8.angles.id, snap_8.angles.id)
+    assert numpy.array_equal(read_snap_8.angles.typeid, snap_8.angles.typeid)
+    assert numpy.array_equal(read_snap_8.angles.members, snap_8.angles.members)
     # test dihedrals
     assert read_snap_8.has_dihedrals()
-    assert numpy.allclose(read_snap_8.dihedrals.id, snap_8.dihedrals.id)
-    assert numpy.allclose(read_snap_8.dihedrals.typeid, snap_8.dihedrals.typeid)
-    assert numpy.allclose(read_snap_8.dihedrals.members, snap_8.dihedrals.members)
+    assert numpy.array_equal(read_snap_8.dihedrals.id, snap_8.dihedrals.id)
+    assert numpy.array_equal(read_snap_8.dihedrals.typeid, snap_8.dihedrals.typeid)
+    assert numpy.array_equal(read_snap_8.dihedrals.members, snap_8.dihedrals.members)
     # test impropers
     assert read_snap_8.has_impropers()
-    assert numpy.allclose(read_snap_8.impropers.id, snap_8.impropers.id)
-    assert numpy.allclose(read_snap_8.impropers.typeid, snap_8.impropers.typeid)
-    assert numpy.allclose(read_snap_8.impropers.members, snap_8.impropers.members)
+    assert numpy.array_equal(read_snap_8.impropers.id, snap_8.impropers.id)
+    assert numpy.array_equal(read_snap_8.impropers.typeid, snap_8.impropers.typeid)
+    assert numpy.array_equal(read_snap_8.impropers.members, snap_8.impropers.members)
 
 
 @pytest.mark.parametrize(
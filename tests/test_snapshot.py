@@ -10,9 +10,49 @@ try:
     import gsd.hoomd
 
     has_gsd = True
+
+    # GSD >= 2.8.0 deprecated Snapshot in favor of Frame
+    try:
+        gsd_version = gsd.version.version
+    except AttributeError:
+        gsd_version = gsd.__version__
+    if version.Version(gsd_version) >= version.Version("2.8.0"):
+        gsd_frame_class = gsd.hoomd.Frame
+    else:
+        gsd_frame_class = gsd.hoomd.Snapshot
 except ModuleNotFoundError:
     has_gsd = False
 
+# HOOMD box used in the GSD conversion tests and the LAMMPS box it converts to
+_GSD_BOX = numpy.array([4, 5, 6, 0.1, 0.2, 0.3])
+_GSD_BOX_LOW = numpy.array([-2, -2.5, -3])
+_GSD_BOX_HIGH = numpy.array([2, 2.5, 3])
+_GSD_BOX_TILT = numpy.array([0.5, 1.2, 1.8])
+
+# particles and connections used in the GSD topology conversion test, built in
+# the dtypes GSD stores and copied into each frame so the frame owns its data
+_TOPOLOGY_POSITION = numpy.array(
+    [
+        [0.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [1.0, 0.0, 0.0],
+        [1.0, 1.0, 0.0],
+        [3.0, 3.0, 0.0],
+        [3.0, 4.0, 0.0],
+        [4.0, 3.0, 0.0],
+        [4.0, 4.0, 0.0],
+    ],
+    dtype=numpy.float32,
+)
+_BOND_GROUP = numpy.array(
+    [[0, 1], [1, 2], [2, 3], [4, 5], [5, 6], [6, 7]], dtype=numpy.uint32
+)
+_ANGLE_GROUP = numpy.array(
+    [[0, 1, 2], [1, 2, 3], [4, 5, 6], [5, 6, 7]], dtype=numpy.uint32
+)
+_DIHEDRAL_GROUP = numpy.array([[0, 1, 2, 3], [4, 5, 6, 7]], dtype=numpy.uint32)
+_IMPROPER_GROUP = numpy.array([[0, 1, 2, 3], [4, 5, 6, 7]], dtype=numpy.uint32)
+
 
 def test_create(snap):
     assert snap.N == 3
@@ -23,16 +63,9 @@ def test_create(snap):
 @pytest.mark.skipif(not has_gsd, reason="gsd not installed")
 def test_gsd_conversion():
     # make a GSD frame
-    try:
-        gsd_version = gsd.version.version
-    except AttributeError:
-        gsd_version = gsd.__version__
-    if version.Version(gsd_version) >= version.Version("2.8.0"):
-        frame = gsd.hoomd.Frame()
-    else:
-        frame = gsd.hoomd.Snapshot()
+    frame = gsd_frame_class()
     frame.configuration.step = 3
-    frame.configuration.box = [4, 5, 6, 0.1, 0.2, 0.3]
+    frame.configuration.box = _GSD_BOX.tolist()
     frame.particles.N = 2
     frame.particles.position = [[0.1, 0.2, 0.3], [-0.1, -0.2, -0.3]]
     frame.particles.image = [[1, -1, 0], [0, 2, -2]]
@@ -45,19 +78,20 @@ def test_gsd_conversion():
 
     # make Snapshot from GSD
     snap, type_map = lammpsio.Snapshot.from_hoomd_gsd(frame)
+    assert numpy.allclose(frame.configuration.box, _GSD_BOX)
     assert snap.step == 3
-    assert numpy.allclose(snap.box.low, [-2, -2.5, -3])
-    assert numpy.allclose(snap.box.high, [2, 2.5, 3])
-    assert numpy.allclose(snap.box.tilt, [0.5, 1.2, 1.8])
+    assert numpy.allclose(snap.box.low, _GSD_BOX_LOW)
+    assert numpy.allclose(snap.box.high, _GSD_BOX_HIGH)
+    assert numpy.allclose(snap.box.tilt, _GSD_BOX_TILT)
     assert snap.N == 2
     assert numpy.allclose(snap.position, [[0.1, 0.2, 0.3], [-0.1, -0.2, -0.3]])
-    assert numpy.all(snap.image == [[1, -1, 0], [0, 2, -2]])
-    assert numpy.allclose(snap.velocity, [[1, 2, 3], [-4, -5, -6]])
-    assert numpy.all(snap.molecule == [1, 0])
-    assert numpy.all(snap.typeid == [2, 1])
+    assert numpy.array_equal(snap.image, [[1, -1, 0], [0, 2, -2]])
+    assert numpy.array_equal(snap.velocity, [[1, 2, 3], [-4, -5, -6]])
+    assert numpy.array_equal(snap.molecule, [1, 0])
+    assert numpy.array_equal(snap.typeid, [2, 1])
     assert snap.type_label == {1: "A", 2: "B"}
-    assert numpy.allclose(snap.mass, [3, 2])
-    assert numpy.allclose(snap.charge, [-1, 1])
+    assert numpy.array_equal(snap.mass, [3, 2])
+    assert numpy.array_equal(snap.charge, [-1, 1])
     assert type_map == {1: "A", 2: "B"}
 
     # go back to GSD frame
@@ -66,25 +100,25 @@ def test_gsd_conversion():
     assert numpy.allclose(frame2.configuration.box, frame.configuration.box)
     assert frame2.particles.N == frame.particles.N
     assert numpy.allclose(frame2.particles.position, frame.particles.position)
-    assert numpy.all(frame2.particles.image == frame.particles.image)
-    assert numpy.allclose(frame2.particles.velocity, frame.particles.velocity)
+    assert numpy.array_equal(frame2.particles.image, frame.particles.image)
+    assert numpy.array_equal(frame2.particles.velocity, frame.particles.velocity)
     assert numpy.all(frame2.particles.types == tuple(frame.particles.types))
-    assert numpy.all(frame2.particles.typeid == frame.particles.typeid)
-    assert numpy.allclose(frame2.particles.mass, frame.particles.mass)
-    assert numpy.allclose(frame2.particles.charge, frame.particles.charge)
-    assert numpy.all(frame2.particles.body == frame.particles.body)
+    assert numpy.array_equal(frame2.particles.typeid, frame.particles.typeid)
+    assert numpy.array_equal(frame2.particles.mass, frame.particles.mass)
+    assert numpy.array_equal(frame2.particles.charge, frame.particles.charge)
+    assert numpy.array_equal(frame2.particles.body, frame.particles.body)
 
     # do the same thing, but use explicit type map (should give warning)
     with pytest.warns(DeprecationWarning):
         frame3 = snap.to_hoomd_gsd({1: "C", 2: "D"})
     assert numpy.all(frame3.particles.types == ("C", "D"))
-    assert numpy.all(frame3.particles.typeid == [1, 0])
+    assert numpy.array_equal(frame3.particles.typeid, [1, 0])
 
     # do the same thing, but with different type_label
     snap.type_label = lammpsio.topology.LabelMap({1: "C", 2: "D"})
     frame4 = snap.to_hoomd_gsd()
     assert numpy.all(frame4.particles.types == tuple(["C", "D"]))
-    assert numpy.all(frame4.particles.typeid == [1, 0])
+    assert numpy.array_equal(frame4.particles.typeid, [1, 0])
 
     # check for warning on floppy molecules
     frame.particles.body = [-2, -1]
@@ -97,7 +131,7 @@ def test_gsd_conversion():
     # check again with id remapping to make sure order is preserved
     snap2.id = [2, 1]
     snap2.to_hoomd_gsd()
-    assert numpy.all(snap2.id == [2, 1])
+    assert numpy.array_equal(snap2.id, [2, 1])
 
     # check for error out on bad box
     snap2.box.low = [-10, -10, -10]
@@ -108,16 +142,9 @@ def test_gsd_conversion():
 @pytest.mark.skipif(not has_gsd, reason="gsd not installed")
 def test_minimal_gsd_conversion():
     # make a GSD frame
-    try:
-        gsd_version = gsd.version.version
-    except AttributeError:
-        gsd_version = gsd.__version__
-    if version.Version(gsd_version) >= version.Version("2.8.0"):
-        frame = gsd.hoomd.Frame()
-    else:
-        frame = gsd.hoomd.Snapshot()
+    frame = gsd_frame_class()
 
-    frame.configuration.box = [4, 5, 6, 0.1, 0.2, 0.3]
+    frame.configuration.box = _GSD_BOX.tolist()
     frame.particles.N = 2
     frame.particles.types = ["A", "B"]
     frame.particles.typeid = [1, 0]
@@ -140,107 +167,72 @@ def test_minimal_gsd_conversion():
 @pytest.mark.skipif(not has_gsd, reason="gsd not installed")
 def test_gsd_conversion_topology():
     # make a GSD frame
-    try:
-        gsd_version = gsd.version.version
-    except AttributeError:
-        gsd_version = gsd.__version__
-    if version.Version(gsd_version) >= version.Version("2.8.0"):
-        frame = gsd.hoomd.Frame()
-    else:
-        frame = gsd.hoomd.Snapshot()
+    frame = gsd_frame_class()
 
     # set box
     frame.configuration.box = [10, 10, 10, 1, 1, 1]
 
     # particles
-    position = [
-        [0.0, 0.0, 0.0],
-        [0.0, 1.0, 0.0],
-        [1.0, 0.0, 0.0],
-        [1.0, 1.0, 0.0],
-        [3.0, 3.0, 0.0],
-        [3.0, 4.0, 0.0],
-        [4.0, 3.0, 0.0],
-        [4.0, 4.0, 0.0],
-    ]
     frame.particles.N = 8
     frame.particles.types = ["A", "B"]
     frame.particles.typeid = [0, 0, 0, 0, 1, 1, 1, 1]
-    frame.particles.position = position
+    frame.particles.position = _TOPOLOGY_POSITION.copy()
 
     # bonds
     frame.bonds.N = 6
     frame.bonds.types = ["bondA", "bondB"]
     frame.bonds.typeid = [0, 1, 0, 1, 0, 1]
-    frame.bonds.group = [
-        [0, 1],
-        [1, 2],
-        [2, 3],
-        [4, 5],
-        [5, 6],
-        [6, 7],
-    ]
+    frame.bonds.group = _BOND_GROUP.copy()
 
     # angles
     frame.angles.N = 4
     frame.angles.types = ["angleA", "angleB"]
     frame.angles.typeid = [0, 1, 0, 1]
-    frame.angles.group = [
-        [0, 1, 2],
-        [1, 2, 3],
-        [4, 5, 6],
-        [5, 6, 7],
-    ]
+    frame.angles.group = _ANGLE_GROUP.copy()
 
     # dihedrals
     frame.dihedrals.N = 2
     frame.dihedrals.types = ["dihedralA", "dihedralB"]
     frame.dihedrals.typeid = [0, 1]
-    frame.dihedrals.group = [
-        [0, 1, 2, 3],
-        [4, 5, 6, 7],
-    ]
+    frame.dihedrals.group = _DIHEDRAL_GROUP.copy()
 
     # impropers
     frame.impropers.N = 2
     frame.impropers.types = ["improperA", "improperB"]
     frame.impropers.typeid = [0, 1]
-    frame.impropers.group = [
-        [0, 1, 2, 3],
-        [4, 5, 6, 7],
-    ]
+    frame.impropers.group = _IMPROPER_GROUP.copy()
 
     # make Snapshot from GSD
     snap, type_map = lammpsio.Snapshot.from_hoomd_gsd(frame)
     # particles
     assert snap.N == 8
-    assert numpy.allclose(snap.position, position)
-    assert numpy.all(snap.typeid == [1, 1, 1, 1, 2, 2, 2, 2])
+    assert numpy.allclose(snap.position, _TOPOLOGY_POSITION)
+    assert numpy.array_equal(snap.typeid, [1, 1, 1, 1, 2, 2, 2, 2])
     assert type_map == {1: "A", 2: "B"}
     assert snap.type_label == {1: "A", 2: "B"}
     # bonds
     assert snap.bonds.N == 6
-    assert numpy.all(snap.bonds.typeid == [1, 2, 1, 2, 1, 2])
-    assert numpy.all(
-        snap.bonds.members == [[1, 2], [2, 3], [3, 4], [5, 6], [6, 7], [7, 8]]
+    assert numpy.array_equal(snap.bonds.typeid, [1, 2, 1, 2, 1, 2])
+    assert numpy.array_equal(
+        snap.bonds.members, [[1, 2], [2, 3], [3, 4], [5, 6], [6, 7], [7, 8]]
     )
     assert snap.bonds.type_label == {1: "bondA", 2: "bondB"}
     # angles
     assert snap.angles.N == 4
-    assert numpy.all(snap.angles.typeid == [1, 2, 1, 2])
-    assert numpy.all(
-        snap.angles.members == [[1, 2, 3], [2, 3, 4], [5, 6, 7], [6, 7, 8]]
+    assert numpy.array_equal(snap.angles.typeid, [1, 2, 1, 2])
+    assert numpy.array_equal(
+        snap.angles.members, [[1, 2, 3], [2, 3, 4], [5, 6, 7], [6, 7, 8]]
     )
     assert snap.angles.type_label == {1: "angleA", 2: "angleB"}
     # dihedrals
     assert snap.dihedrals.N == 2
-    assert numpy.all(snap.dihedrals.typeid == [1, 2])
-    assert numpy.all(snap.dihedrals.members == [[1, 2, 3, 4], [5, 6, 7, 8]])
+    assert numpy.array_equal(snap.dihedrals.typeid, [1, 2])
+    assert numpy.array_equal(snap.dihedrals.members, [[1, 2, 3, 4], [5, 6, 7, 8]])
     assert snap.dihedrals.type_label == {1: "dihedralA", 2: "dihedralB"}
     # impropers
     assert snap.impropers.N == 2
-    assert numpy.all(snap.impropers.typeid == [1, 2])
-    assert numpy.all(snap.impropers.members == [[1, 2, 3, 4], [5, 6, 7, 8]])
+    assert numpy.array_equal(snap.impropers.typeid, [1, 2])
+    assert numpy.array_equal(snap.impropers.members, [[1, 2, 3, 4], [5, 6, 7, 8]])
     assert snap.impropers.type_label == {1: "improperA", 2: "improperB"}
 
     # go back to GSD frame
@@ -248,98 +240,94 @@ def test_gsd_conversion_topology():
     assert numpy.allclose(frame2.configuration.box, frame.configuration.box)
     # particles
     assert frame2.particles.N == frame.particles.N
-    assert numpy.allclose(frame2.particles.position, frame.particles.position)
+    assert numpy.array_equal(frame2.particles.position, frame.particles.position)
     assert numpy.all(frame2.particles.types == tuple(frame.particles.types))
-    assert numpy.all(frame2.particles.typeid == frame.particles.typeid)
+    assert numpy.array_equal(frame2.particles.typeid, frame.particles.typeid)
     # bonds
     assert frame2.bonds.N == frame.bonds.N
     assert numpy.all(frame2.bonds.types == tuple(frame.bonds.types))
-    assert numpy.all(frame2.bonds.typeid == frame.bonds.typeid)
-    assert numpy.all(frame2.bonds.group == frame.bonds.group)
+    assert numpy.array_equal(frame2.bonds.typeid, frame.bonds.typeid)
+    assert numpy.array_equal(frame2.bonds.group, frame.bonds.group)
     # angles
     assert frame2.angles.N == frame.angles.N
     assert numpy.all(frame2.angles.types == tuple(frame.angles.types))
-    assert numpy.all(frame2.angles.typeid == frame.angles.typeid)
-    assert numpy.all(frame2.angles.group == frame.angles.group)
+    assert numpy.array_equal(frame2.angles.typeid, frame.angles.typeid)
+    assert numpy.array_equal(frame2.angles.group, frame.angles.group)
     # dihedrals
     assert frame2.dihedrals.N == frame.dihedrals.N
     assert numpy.all(frame2.dihedrals.types == tuple(frame.dihedrals.types))
-    assert numpy.all(frame2.dihedrals.typeid == frame.dihedrals.typeid)
-    assert numpy.all(frame2.dihedrals.group == frame.dihedrals.group)
+    assert numpy.array_equal(frame2.dihedrals.typeid, frame.dihedrals.typeid)
+    assert numpy.array_equal(frame2.dihedrals.group, frame.dihedrals.group)
     # impropers
     assert frame2.impropers.N == frame.impropers.N
     assert numpy.all(frame2.impropers.types == tuple(frame.impropers.types))
-    assert numpy.all(frame2.impropers.typeid == frame.impropers.typeid)
-    assert numpy.all(frame2.impropers.group == frame.impropers.group)
-
-
-def test_position(snap):
-    assert not snap.has_position()
-    assert numpy.allclose(snap.position, 0.0)
-    position = [[0.1, 0.2, 0.3], [-0.4, -0.5, -0.6], [100, -200, 300]]
-    snap.position = position
-    assert numpy.allclose(snap.position, position)
-    with pytest.raises(TypeError):
-        snap.position = [[0, 0, 0], [0, 0, 0]]
-    with pytest.raises(TypeError):
-        snap.position = [0, 0, 0]
-
-
-def test_image(snap):
-    assert not snap.has_image()
-    assert numpy.allclose(snap.image, 0)
-    image = [[1, 2, 3], [-1, 0, -2], [100, -200, 300]]
-    snap.image = image
-    assert numpy.allclose(snap.image, image)
-    with pytest.raises(TypeError):
-        snap.image = [[0, 0, 0], [0, 0, 0]]
-    with pytest.raises(TypeError):
-        snap.image = [0, 0, 0]
-
-
-def test_velocity(snap):
-    assert not snap.has_velocity()
-    assert numpy.allclose(snap.velocity, 0.0)
-    velocity = [[0.1, 0.2, 0.3], [-0.4, -0.5, -0.6], [100, -200, 300]]
-    snap.velocity = velocity
-    assert numpy.allclose(snap.velocity, velocity)
-    with pytest.raises(TypeError):
-        snap.velocity = [[0, 0, 0], [0, 0, 0]]
-    with pytest.raises(TypeError):
-        snap.velocity = [0, 0, 0]
-
-
-def test_typeid(snap):
-    assert not snap.has_typeid()
-    assert numpy.allclose(snap.typeid, 1)
-    typeid = [2, 1, 3]
-    snap.typeid = typeid
-    assert numpy.allclose(snap.typeid, typeid)
-    with pytest.raises(TypeError):
-        snap.typeid = [1, 1]
-
-
-def test_molecule(snap):
-    assert not snap.has_molecule()
-    assert numpy.allclose(snap.molecule, 0)
-    molecule = [2, 0, 1]
-    snap.molecule = molecule
-    assert numpy.allclose(snap.molecule, molecule)
-    with pytest.raises(TypeError):
-        snap.molecule = [0, 0]
-
-
-def test_mass(snap):
-    assert not snap.has_mass()
-    assert numpy.allclose(snap.mass, 1)
-    # also set typeid, so that types and masses are consistent as LAMMPS requires
-    # removing this line doesn't actually do anything, though
-    snap.typeid = [1, 2, 1]
-    mass = [2, 3, 2]
-    snap.mass = mass
-    assert numpy.allclose(snap.mass, mass)
-    with pytest.raises(TypeError):
-        snap.mass = [1, 1]
+    assert numpy.array_equal(frame2.impropers.typeid, frame.impropers.typeid)
+    assert numpy.array_equal(frame2.impropers.group, frame.impropers.group)
+
+
+@pytest.mark.skipif(not has_gsd, reason="gsd not installed")
+@pytest.mark.parametrize(
+    "name, num_members",
+    [("bonds", 2), ("angles", 3), ("dihedrals", 4), ("impropers", 4)],
+    ids=["bonds", "angles", "dihedrals", "impropers"],
+)
+@pytest.mark.parametrize(
+    "group_shape", [(1, None), (2, 1)], ids=["too_few", "too_narrow"]
+)
+def test_gsd_conversion_topology_wrong_shape(name, num_members, group_shape):
+    frame = gsd_frame_class()
+    frame.configuration.box = [10, 10, 10, 0, 0, 0]
+    frame.particles.N = 8
+
+    # GSD >= 5 does not check the shape of the group, so lammpsio must, but older
+    # versions reject it in validate before it reaches lammpsio
+    N, width = group_shape
+    if width is None:
+        width = num_members
+    topology = getattr(frame, name)
+    topology.N = 2
+    topology.group = numpy.zeros((N, width), dtype=numpy.uint32)
+    with pytest.raises((TypeError, ValueError)):
+        lammpsio.Snapshot.from_hoomd_gsd(frame)
+
+
+@pytest.mark.parametrize(
+    "field, default, value, bad_values",
+    [
+        (
+            "position",
+            0.0,
+            [[0.1, 0.2, 0.3], [-0.4, -0.5, -0.6], [100, -200, 300]],
+            [[[0, 0, 0], [0, 0, 0]], [0, 0, 0]],
+        ),
+        (
+            "image",
+            0,
+            [[1, 2, 3], [-1, 0, -2], [100, -200, 300]],
+            [[[0, 0, 0], [0, 0, 0]], [0, 0, 0]],
+        ),
+        (
+            "velocity",
+            0.0,
+            [[0.1, 0.2, 0.3], [-0.4, -0.5, -0.6], [100, -200, 300]],
+            [[[0, 0, 0], [0, 0, 0]], [0, 0, 0]],
+        ),
+        ("typeid", 1, [2, 1, 3], [[1, 1]]),
+        ("molecule", 0, [2, 0, 1], [[0, 0]]),
+        ("mass", 1, [2, 3, 2], [[1, 1]]),
+        ("charge", 0, [-1, 0, 1], [[0, 0]]),
+    ],
+    ids=["position", "image", "velocity", "typeid", "molecule", "mass", "charge"],
+)
+def test_per_particle(snap, field, default, value, bad_values):
+    assert not getattr(snap, f"has_{field}")()
+    assert numpy.allclose(getattr(snap, field), default)
+    setattr(snap, field, value)
+    assert getattr(snap, f"has_{field}")()
+    assert numpy.allclose(getattr(snap, field), value)
+    for bad_value in bad_values:
+        with pytest.raises(TypeError):
+            setattr(snap, field, bad_value)
 
 
 def test_bonds(snap_8):
@@ -359,9 +347,9 @@ def test_bonds(snap_8):
     snap_8.bonds.typeid = typeid
     snap_8.bonds.members = members
 
-    assert numpy.allclose(snap_8.bonds.id, id)
-    assert numpy.allclose(snap_8.bonds.typeid, typeid)
-    assert numpy.allclose(snap_8.bonds.members, members)
+    assert numpy.array_equal(snap_8.bonds.id, id)
+    assert numpy.array_equal(snap_8.bonds.typeid, typeid)
+    assert numpy.array_equal(snap_8.bonds.members, members)
 
 
 def test_angles(snap_8):
@@ -384,9 +372,9 @@ def test_angles(snap_8):
     snap_8.angles.typeid = typeid
     snap_8.angles.members = members
 
-    assert numpy.allclose(snap_8.angles.id, id)
-    assert numpy.allclose(snap_8.angles.typeid, typeid)
-    assert numpy.allclose(snap_8.angles.members, members)
+    assert numpy.array_equal(snap_8.angles.id, id)
+    assert numpy.array_equal(snap_8.angles.typeid, typeid)
+    assert numpy.array_equal(snap_8.angles.members, members)
 
 
 def test_dihedrals(snap_8):
@@ -402,9 +390,9 @@ def test_dihedrals(snap_8):
     snap_8.dihedrals.typeid = typeid
     snap_8.dihedrals.members = members
 
-    assert numpy.allclose(snap_8.dihedrals.id, id)
-    assert numpy.allclose(snap_8.dihedrals.typeid, typeid)
-    assert numpy.allclose(snap_8.dihedrals.members, members)
+    assert numpy.array_equal(snap_8.dihedrals.id, id)
+    assert numpy.array_equal(snap_8.dihedrals.typeid, typeid)
+    assert numpy.array_equal(snap_8.dihedrals.members, members)
 
 
 def test_impropers(snap_8):
@@ -420,19 +408,9 @@ def test_impropers(snap_8):
     snap_8.impropers.typeid = typeid
     snap_8.impropers.members = members
 
-    assert numpy.allclose(snap_8.impropers.id, id)
-    assert numpy.allclose(snap_8.impropers.typeid, typeid)
-    assert numpy.allclose(snap_8.impropers.members, members)
-
-
-def test_charge(snap):
-    assert not snap.has_charge()
-    assert numpy.allclose(snap.charge, 0)
-    charge = [-1, 0, 1]
-    snap.charge = charge
-    assert numpy.allclose(snap.charge, charge)
-    with pytest.raises(TypeError):
-        snap.typeid = [0, 0]
+    assert numpy.array_equal(snap_8.impropers.id, id)
+    assert numpy.array_equal(snap_8.impropers.typeid, typeid)
+    assert numpy.array_equal(snap_8.impropers.members, members)
 
 
 def test_copy(snap):
@@ -447,28 +425,28 @@ def test_copy(snap):
 
     # check shallow copy works
     snap_shallow = copy.copy(snap)
-    assert numpy.all(snap_shallow.id == snap.id)
-    assert numpy.allclose(snap_shallow.position, snap.position)
-    assert numpy.all(snap_shallow.image == snap.image)
-    assert numpy.allclose(snap_shallow.velocity, snap.velocity)
-    assert numpy.all(snap_shallow.typeid == snap.typeid)
-    assert numpy.allclose(snap_shallow.mass, snap.mass)
-    assert numpy.all(snap_shallow.molecule == snap.molecule)
-    assert numpy.allclose(snap_shallow.charge, snap.charge)
+    assert numpy.array_equal(snap_shallow.id, snap.id)
+    assert numpy.array_equal(snap_shallow.position, snap.position)
+    assert numpy.array_equal(snap_shallow.image, snap.image)
+    assert numpy.array_equal(snap_shallow.velocity, snap.velocity)
+    assert numpy.array_equal(snap_shallow.typeid, snap.typeid)
+    assert numpy.array_equal(snap_shallow.mass, snap.mass)
+    assert numpy.array_equal(snap_shallow.molecule, snap.molecule)
+    assert numpy.array_equal(snap_shallow.charge, snap.charge)
 
     # check deep copy works
     snap_deep = copy.deepcopy(snap)
-    assert numpy.all(snap_deep.id == snap.id)
-    assert numpy.allclose(snap_deep.position, snap.position)
-    assert numpy.all(snap_deep.image == snap.image)
-    assert numpy.allclose(snap_deep.velocity, snap.velocity)
-    assert numpy.all(snap_deep.typeid == snap.typeid)
-    assert numpy.allclose(snap_deep.mass, snap.mass)
-    assert numpy.all(snap_deep.molecule == snap.molecule)
-    assert numpy.allclose(snap_deep.charge, snap.charge)
+    assert numpy.array_equal(snap_deep.id, snap.id)
+    assert numpy.array_equal(snap_deep.position, snap.position)
+    assert numpy.array_equal(snap_deep.image, snap.image)
+    assert numpy.array_equal(snap_deep.velocity, snap.velocity)
+    assert numpy.array_equal(snap_deep.typeid, snap.typeid)
+    assert numpy.array_equal(snap_deep.mass, snap.mass)
+    assert numpy.array_equal(snap_deep.molecule, snap.molecule)
+    assert numpy.array_equal(snap_deep.charge, snap.charge)
 
     # change the original snapshot and check shallow changes, but deep does not
     old_ids = list(snap.id)
     snap.id = [3, 4, 5]
-    assert numpy.all(snap_shallow.id == snap.id)
-    assert numpy.all(snap_deep.id == old_ids)
+    assert numpy.array_equal(snap_shallow.id, snap.id)
+    assert numpy.array_equal(snap_deep.id, old_ids)
@@ -1,204 +1,115 @@
+import copy
+
+import numpy
 import pytest
 
 import lammpsio
 
-
-def test_bonds(snap_8):
-    # default is no bonds
-    assert snap_8.bonds is None
-    assert not snap_8.has_bonds()
-
-    # empty bonds set still means we don't have bonds
-    bonds = lammpsio.Bonds(N=0)
-    snap_8.bonds = bonds
-    assert snap_8.bonds is bonds
-    assert not snap_8.has_bonds()
-
-    # one bond counts as bonds
-    bonds = lammpsio.Bonds(N=1)
-    snap_8.bonds = bonds
-    assert snap_8.bonds is bonds
-    assert snap_8.has_bonds()
+# inputs with one connection too many for the topologies in test_wrong_shape
+_BAD_BONDS = {
+    "id": (1, 2, 3, 4, 5, 6, 7),
+    "typeid": (1, 1, 1, 2, 2, 2, 3),
+    "members": ((1, 2), (2, 3), (3, 4), (5, 6), (6, 7), (7, 8), (8, 9)),
+}
+_BAD_ANGLES = {
+    "id": (1, 2, 3, 4, 5),
+    "typeid": (1, 1, 2, 2, 3),
+    "members": ((1, 2, 3), (2, 3, 4), (5, 6, 7), (6, 7, 8), (7, 8, 9)),
+}
+_BAD_DIHEDRALS = {
+    "id": (1, 2, 3),
+    "typeid": (1, 2, 3),
+    "members": ((1, 2, 3, 4), (5, 6, 7, 8), (6, 7, 8, 9)),
+}
+_BAD_IMPROPERS = {
+    "id": (1, 2, 3),
+    "typeid": (1, 2, 3),
+    "members": ((1, 2, 3, 4), (5, 6, 7, 8), (6, 7, 8, 9)),
+}
+
+
+@pytest.mark.parametrize(
+    "name, topology_class, other_class",
+    [
+        ("bonds", lammpsio.Bonds, lammpsio.Angles),
+        ("angles", lammpsio.Angles, lammpsio.Bonds),
+        ("dihedrals", lammpsio.Dihedrals, lammpsio.Angles),
+        ("impropers", lammpsio.Impropers, lammpsio.Angles),
+    ],
+    ids=["bonds", "angles", "dihedrals", "impropers"],
+)
+def test_topology(snap_8, name, topology_class, other_class):
+    has_topology = getattr(snap_8, f"has_{name}")
+
+    # default is no topology
+    assert getattr(snap_8, name) is None
+    assert not has_topology()
+
+    # empty topology set still means we don't have topology
+    topology = topology_class(N=0)
+    setattr(snap_8, name, topology)
+    assert getattr(snap_8, name) is topology
+    assert not has_topology()
+
+    # one connection counts as topology
+    topology = topology_class(N=1)
+    setattr(snap_8, name, topology)
+    assert getattr(snap_8, name) is topology
+    assert has_topology()
 
     # make sure can set back to None
-    snap_8.bonds = None
-    assert snap_8.bonds is None
-    assert not snap_8.has_bonds()
+    setattr(snap_8, name, None)
+    assert getattr(snap_8, name) is None
+    assert not has_topology()
 
     # make sure other types cannot be set and nothing changes
     with pytest.raises(TypeError):
-        snap_8.bonds = lammpsio.Angles(N=0)
-    assert snap_8.bonds is None
-    assert not snap_8.has_bonds()
-
-
-def test_angles(snap_8):
-    # default is no angles
-    assert snap_8.angles is None
-    assert not snap_8.has_angles()
-
-    # empty angles set still means we don't have angles
-    angles = lammpsio.Angles(N=0)
-    snap_8.angles = angles
-    assert snap_8.angles is angles
-    assert not snap_8.has_angles()
-
-    # one bond counts as angles
-    angles = lammpsio.Angles(N=1)
-    snap_8.angles = angles
-    assert snap_8.angles is angles
-    assert snap_8.has_angles()
-
-    # make sure can set back to None
-    snap_8.angles = None
-    assert snap_8.angles is None
-    assert not snap_8.has_angles()
-
-    # make sure other types cannot be set and nothing changes
-    with pytest.raises(TypeError):
-        snap_8.angles = lammpsio.Bonds(N=0)
-    assert snap_8.angles is None
-    assert not snap_8.has_angles()
-
-
-def test_dihedrals(snap_8):
-    # default is no dihedrals
-    assert snap_8.dihedrals is None
-    assert not snap_8.has_dihedrals()
-
-    # empty dihedrals set still means we don't have dihedrals
-    dihedrals = lammpsio.Dihedrals(N=0)
-    snap_8.dihedrals = dihedrals
-    assert snap_8.dihedrals is dihedrals
-    assert not snap_8.has_dihedrals()
-
-    # one bond counts as dihedrals
-    dihedrals = lammpsio.Dihedrals(N=1)
-    snap_8.dihedrals = dihedrals
-    assert snap_8.dihedrals is dihedrals
-    assert snap_8.has_dihedrals()
-
-    # make sure can set back to None
-    snap_8.dihedrals = None
-    assert snap_8.dihedrals is None
-    assert not snap_8.has_dihedrals()
-
-    # make sure other types cannot be set and nothing changes
-    with pytest.raises(TypeError):
-        snap_8.dihedrals = lammpsio.Angles(N=0)
-    assert snap_8.dihedrals is None
-    assert not snap_8.has_dihedrals()
-
-
-def test_impropers(snap_8):
-    # default is no impropers
-    assert snap_8.impropers is None
-    assert not snap_8.has_impropers()
-
-    # empty impropers set still means we don't have impropers
-    impropers = lammpsio.Impropers(N=0)
-    snap_8.impropers = impropers
-    assert snap_8.impropers is impropers
-    assert not snap_8.has_impropers()
-
-    # one bond counts as impropers
-    impropers = lammpsio.Impropers(N=1)
-    snap_8.impropers = impropers
-    assert snap_8.impropers is impropers
-    assert snap_8.has_impropers()
-
-    # make sure can set back to None
-    snap_8.impropers = None
-    assert snap_8.impropers is None
-    assert not snap_8.has_impropers()
-
-    # make sure other types cannot be set and nothing changes
-    with pytest.raises(TypeError):
-        snap_8.impropers = lammpsio.Angles(N=0)
-    assert snap_8.impropers is None
-    assert not snap_8.has_impropers()
-
-
-def test_bonds_wrong_shape(snap_8):
-    snap_8.bonds = lammpsio.topology.Bonds(N=6, num_types=2)
-
-    # check that error is raised if array is the wrong shape
-    id = [1, 2, 3, 4, 5, 6, 7]
-    with pytest.raises(TypeError):
-        snap_8.bonds.id = id
-
-    typeid = [1, 1, 1, 2, 2, 2, 3]
-    with pytest.raises(TypeError):
-        snap_8.bonds.typeid = typeid
-
-    members = [[1, 2], [2, 3], [3, 4], [5, 6], [6, 7], [7, 8], [8, 9]]
-    with pytest.raises(TypeError):
-        snap_8.bonds.members = members
-
-
-def test_angles_wrong_shape(snap_8):
-    snap_8.angles = lammpsio.topology.Angles(N=4, num_types=2)
-
-    # check that error is raised if array is the wrong shape
-    id = [1, 2, 3, 4, 5]
-    with pytest.raises(TypeError):
-        snap_8.angles.id = id
-
-    typeid = [1, 1, 2, 2, 3]
-    with pytest.raises(TypeError):
-        snap_8.angles.typeid = typeid
-
-    members = [
-        [1, 2, 3],
-        [2, 3, 4],
-        [5, 6, 7],
-        [6, 7, 8],
-        [7, 8, 9],
-    ]
-    with pytest.raises(TypeError):
-        snap_8.angles.members = members
-
-
-def test_dihedrals_wrong_shape(snap_8):
-    snap_8.dihedrals = lammpsio.topology.Dihedrals(N=2, num_types=2)
-
-    # check that error is raised if array is the wrong shape
-    id = [1, 2, 3]
-    with pytest.raises(TypeError):
-        snap_8.dihedrals.id = id
-
-    typeid = [1, 2, 3]
-    with pytest.raises(TypeError):
-        snap_8.dihedrals.typeid = typeid
-
-    members = [
-        [1, 2, 3, 4],
-        [5, 6, 7, 8],
-        [6, 7, 8, 9],
-    ]
-    with pytest.raises(TypeError):
-        snap_8.dihedrals.members = members
-
-
-def test_impropers_wrong_shape(snap_8):
-    snap_8.impropers = lammpsio.topology.Impropers(N=2, num_types=2)
-
-    # check that error is raised if array is the wrong shape
-    id = [1, 2, 3]
-    with pytest.raises(TypeError):
-        snap_8.impropers.id = id
-
-    typeid = [1, 2, 3]
-    with pytest.raises(TypeError):
-        snap_8.impropers.typeid = typeid
-
-    members = [
-        [1, 2, 3, 4],
-        [5, 6, 7, 8],
-        [6, 7, 8, 9],
-    ]
-    with pytest.raises(TypeError):
-        snap_8.impropers.members = members
+        setattr(snap_8, name, other_class(N=0))
+    assert getattr(snap_8, name) is None
+    assert not has_topology()
+
+
+@pytest.mark.parametrize("as_array", [False, True], ids=["sequence", "array"])
+@pytest.mark.parametrize("field", ["id", "typeid", "members"])
+@pytest.mark.parametrize(
+    "name, topology_class, N, bad_values",
+    [
+        ("bonds", lammpsio.Bonds, 6, _BAD_BONDS),
+        ("angles", lammpsio.Angles, 4, _BAD_ANGLES),
+        ("dihedrals", lammpsio.Dihedrals, 2, _BAD_DIHEDRALS),
+        ("impropers", lammpsio.Impropers, 2, _BAD_IMPROPERS),
+    ],
+    ids=["bonds", "angles", "dihedrals", "impropers"],
+)
+def test_wrong_shape(snap_8, name, topology_class, N, bad_values, field, as_array):
+    setattr(snap_8, name, topology_class(N=N, num_types=2))
+    topology = getattr(snap_8, name)
+
+    # check that error is raised if array is the wrong shape, both for
+    # sequences and for arrays that the setters can use without conversion
+    value = bad_values[field]
+    if as_array:
+        value = numpy.array(value, dtype=int)
+    with pytest.raises(TypeError):
+        setattr(topology, field, value)
+
+
+def test_reorder():
+    bonds = lammpsio.Bonds(N=3)
+    bonds.id = [3, 1, 2]
+    bonds.typeid = [2, 1, 1]
+    bonds.members = [[1, 2], [3, 4], [5, 6]]
+
+    # order given as a list is applied to every field
+    bonds.reorder([1, 2, 0])
+    assert numpy.array_equal(bonds.id, [1, 2, 3])
+    assert numpy.array_equal(bonds.typeid, [1, 1, 2])
+    assert numpy.array_equal(bonds.members, [[3, 4], [5, 6], [1, 2]])
+
+    # invalid order raises error and nothing changes
+    with pytest.raises(ValueError):
+        bonds.reorder([0, 0, 1])
+    assert numpy.array_equal(bonds.id, [1, 2, 3])
 
 
 def test_LabelMap():
@@ -214,6 +125,17 @@ def test_LabelMap():
     # set
     label[3] = "typeC"
     assert label[3] == "typeC"
+    assert label.types == ("typeA", "typeB", "typeC")
+    assert label.typeid == (1, 2, 3)
     # delete
     del label[3]
     assert 3 not in label
+    assert label.types == ("typeA", "typeB")
+    assert label.typeid == (1, 2)
+
+    # copies do not share the map or the cached types with the original
+    for label_copy in (copy.copy(label), copy.deepcopy(label)):
+        label_copy[3] = "typeC"
+        assert label_copy.types == ("typeA", "typeB", "typeC")
+        assert label.types == ("typeA", "typeB")
+        assert 3 not in label